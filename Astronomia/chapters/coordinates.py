@@ -19,8 +19,12 @@ Unidades soportadas:
     - 'hms': Horas, Minutos, Segundos (tupla o array Nx3)
 """
 
+import functools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from typing import Tuple, Union, Any, Literal
+from typing import Tuple, Union, Any, Literal, Optional
 from ..core import constants as k
 from ..core import utils
 
@@ -42,6 +46,34 @@ class Unidad:
     DMS = 'dms'     # Tupla (g, m, s)
     HMS = 'hms'     # Tupla (h, m, s)
 
+# Polo galáctico J2000 (invariantes: se evalúan una sola vez al importar)
+_AP = float(k.ALPHA_GP_J2000)
+_DP = float(k.DELTA_GP_J2000)
+_LNODE = float(k.L_NODE_J2000)
+_L_NCP = _LNODE + math.pi/2   # Longitud galáctica del polo norte celeste
+_SIN_DP, _COS_DP = math.sin(_DP), math.cos(_DP)
+
+def _matriz_equ_a_gal():
+    """Rotación Ecuatorial -> Galáctico (J2000), construida desde el polo."""
+    sin_ap, cos_ap = np.sin(_AP), np.cos(_AP)
+    sin_ln, cos_ln = np.sin(_L_NCP), np.cos(_L_NCP)
+    # Ejes (x, y, z) del triedro del polo galáctico, en coordenadas ecuatoriales
+    polo = np.array([
+        [-_SIN_DP * cos_ap, -_SIN_DP * sin_ap, _COS_DP],
+        [-sin_ap,            cos_ap,           0.0],
+        [_COS_DP * cos_ap,   _COS_DP * sin_ap, _SIN_DP],
+    ])
+    # l = l_NCP - theta
+    nodo = np.array([
+        [cos_ln,  sin_ln, 0.0],
+        [sin_ln, -cos_ln, 0.0],
+        [0.0,     0.0,    1.0],
+    ])
+    return nodo @ polo
+
+_R_EQU_A_GAL = _matriz_equ_a_gal()
+_R_EQU_A_GAL.setflags(write=False) # Compartida: solo lectura
+
 # ==============================================================================
 # Función Maestra de Conversión
 # ==============================================================================
@@ -101,21 +133,103 @@ def transformar(
         out2_rad = np.pi/2 - out2_rad
 
     # 4. Formatear salida
-    es_tiempo_salida = True if destino in [Sistema.HORARIO, Sistema.ECUATORIAL] else False
-    res1 = _rad_a_output(out1_rad, unidad_out, es_tiempo=es_tiempo_salida)
-    res2 = _rad_a_output(out2_rad, unidad_out, es_tiempo=False)
+    return _formatear_salida(out1_rad, out2_rad, destino, unidad_out)
 
-    return res1, res2
+def transformar_lote(
+    c1: np.ndarray,
+    c2: np.ndarray,
+    origen: str,
+    destino: str,
+    unidad_in: str = Unidad.RAD,
+    unidad_out: str = Unidad.RAD,
+    *,
+    n_workers: Optional[int] = None,
+    chunksize: int = 10_000,
+    **kwargs
+) -> Tuple[Any, Any]:
+    """
+    Igual que transformar(), pero reparte un catálogo entre varios procesos.
+
+    Solo compensa con varios núcleos y catálogos grandes: con un único núcleo
+    (o n_workers=1) se procesa en el proceso actual, igual que transformar().
+
+    Argumentos:
+        c1, c2: Arrays de coordenadas (N,) o, para 'dms'/'hms', (N, 3). Se
+                combinan con broadcasting (ej. c2 escalar).
+        n_workers: Número de procesos (default: núcleos disponibles).
+        chunksize: Estrellas por bloque (> 0). Si el catálogo cabe en un solo
+                   bloque, se procesa en el proceso actual.
+        **kwargs: Contexto, ver transformar(). Los valores por estrella (arrays
+                  de longitud N, ej. TS_h) se reparten con los mismos bloques.
+
+    Retorna:
+        (res1, res2): Coordenadas transformadas en el formato 'unidad_out'.
+    """
+    if chunksize <= 0:
+        raise ValueError(f"chunksize debe ser positivo: {chunksize}")
+
+    c1, c2 = np.broadcast_arrays(np.asarray(c1), np.asarray(c2))
+    # En 'dms'/'hms' el último eje es la terna (g, m, s), no estrellas
+    dims_terna = 1 if unidad_in in (Unidad.DMS, Unidad.HMS) else 0
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if c1.ndim <= dims_terna or n_workers <= 1:
+        return transformar(c1, c2, origen, destino, unidad_in, unidad_out, **kwargs)
+
+    n = c1.shape[0]
+    n_bloques = -(-n // chunksize)
+    if n_bloques == 1:
+        return transformar(c1, c2, origen, destino, unidad_in, unidad_out, **kwargs)
+
+    # Contexto por estrella: se trocea igual que las coordenadas
+    por_estrella = {}
+    for clave, valor in kwargs.items():
+        if np.ndim(valor) > 0:
+            if np.shape(valor)[0] != n:
+                raise ValueError(
+                    f"El parámetro '{clave}' tiene {np.shape(valor)[0]} valores; "
+                    f"se esperaba uno por estrella ({n})")
+            por_estrella[clave] = np.array_split(np.asarray(valor), n_bloques)
+
+    # Cada estrella es independiente: los bloques se transforman a radianes en
+    # paralelo y el formato de salida se aplica una sola vez sobre el resultado.
+    tareas = []
+    for i, (b1, b2) in enumerate(zip(np.array_split(c1, n_bloques), np.array_split(c2, n_bloques))):
+        ctx_bloque = dict(kwargs, **{clave: bloques[i] for clave, bloques in por_estrella.items()})
+        tareas.append((b1, b2, origen, destino, unidad_in, ctx_bloque))
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        resultados = list(pool.map(_transformar_bloque, tareas))
+
+    out1_rad = np.concatenate([r[0] for r in resultados])
+    out2_rad = np.concatenate([r[1] for r in resultados])
+    return _formatear_salida(out1_rad, out2_rad, destino, unidad_out)
 
 # ==============================================================================
 # Lógica Interna (Privada)
 # ==============================================================================
 
+def _formatear_salida(out1_rad, out2_rad, destino, unidad_out):
+    """Radianes -> formato 'unidad_out' (la primera coordenada es tiempo en HORARIO/ECUATORIAL)."""
+    es_tiempo_salida = True if destino in [Sistema.HORARIO, Sistema.ECUATORIAL] else False
+    res1 = _rad_a_output(out1_rad, unidad_out, es_tiempo=es_tiempo_salida)
+    res2 = _rad_a_output(out2_rad, unidad_out, es_tiempo=False)
+    return res1, res2
+
+def _transformar_bloque(tarea):
+    """Worker de transformar_lote (nivel de módulo para poder serializarlo)."""
+    c1, c2, origen, destino, unidad_in, kwargs = tarea
+    return transformar(c1, c2, origen, destino, unidad_in, Unidad.RAD, **kwargs)
+
 def _nucleo_transformacion(c1, c2, origen, destino, ctx):
     """Motor Hub & Spoke en Radianes puro."""
     if origen == destino:
         return c1, c2
 
+    # Catálogos (arrays) con dos etapas (X -> Ecuatorial -> Y): una única
+    # rotación 3x3 compuesta. Un solo salto va directo por su fórmula.
+    if _es_lote(c1, c2, origen, destino, ctx):
+        return _nucleo_matricial(c1, c2, origen, destino, ctx)
+
     # --- PASO 1: Origen -> HUB (Ecuatorial Absoluto: alpha, delta) ---
     alpha, delta = 0.0, 0.0
 
@@ -155,125 +269,229 @@ def _nucleo_transformacion(c1, c2, origen, destino, ctx):
     
     raise ValueError(f"Sistema destino no soportado: {destino}")
 
+def _es_lote(c1, c2, origen, destino, ctx):
+    """True si conviene la rotación compuesta: arrays, conversión en dos etapas
+    (ni origen ni destino Ecuatorial) y contexto (phi, TS, epsilon) escalar."""
+    if Sistema.ECUATORIAL in (origen, destino):
+        return False
+    if np.ndim(c1) == 0 and np.ndim(c2) == 0:
+        return False
+    return all(np.ndim(ctx[key]) == 0 for key in ('phi', 'TS', 'epsilon') if key in ctx)
+
+def _nucleo_matricial(c1, c2, origen, destino, ctx):
+    """Hub & Spoke con vectores unitarios: v_destino = R_destino @ R_origen.T @ v_origen."""
+    R_origen = _matriz_desde_ecuatorial(origen, ctx)
+    R_destino = _matriz_desde_ecuatorial(destino, ctx)
+    R = R_destino @ R_origen.T
+
+    # Horizontal trabaja con distancia cenital: latitud = 90 - z
+    lat = np.pi/2 - c2 if origen == Sistema.HORIZONTAL else c2
+    lon, lat = _a_esfericas(np.tensordot(R, _a_cartesianas(c1, lat), axes=1))
+    if destino == Sistema.HORIZONTAL:
+        lat = np.pi/2 - lat
+    return lon, lat
+
+def _matriz_desde_ecuatorial(sistema, ctx):
+    """Matriz que lleva un vector Ecuatorial (alpha, delta) al sistema indicado."""
+    if sistema == Sistema.ECUATORIAL:
+        return np.eye(3)
+    elif sistema == Sistema.HORARIO:
+        _validar_ctx(ctx, 'TS', sistema)
+        return _r_equ_a_horario(ctx['TS'])
+    elif sistema == Sistema.HORIZONTAL:
+        _validar_ctx(ctx, ['phi', 'TS'], sistema)
+        return _r_horario_a_horizontal(ctx['phi']) @ _r_equ_a_horario(ctx['TS'])
+    elif sistema == Sistema.ECLIPTICO:
+        return _r_equ_a_ecl(float(ctx.get('epsilon', k.EPSILON_J2000)))
+    elif sistema == Sistema.GALACTICO:
+        return _R_EQU_A_GAL
+    raise ValueError(f"Sistema no soportado: {sistema}")
+
+def _r_equ_a_horario(TS):
+    """(alpha, delta) -> (H, delta) con H = TS - alpha (reflexión, es su propia inversa)."""
+    sin_t, cos_t = np.sin(TS), np.cos(TS)
+    return np.array([
+        [cos_t,  sin_t, 0.0],
+        [sin_t, -cos_t, 0.0],
+        [0.0,    0.0,   1.0],
+    ])
+
+def _r_horario_a_horizontal(phi):
+    """(H, delta) -> (A, h). A desde el SUR."""
+    sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+    return np.array([
+        [sin_phi, 0.0, -cos_phi],
+        [0.0,     1.0,  0.0],
+        [cos_phi, 0.0,  sin_phi],
+    ])
+
+@functools.lru_cache(maxsize=16)
+def _r_equ_a_ecl(eps):
+    """Giro de ángulo epsilon alrededor del eje del equinoccio."""
+    sin_e, cos_e = np.sin(eps), np.cos(eps)
+    R = np.array([
+        [1.0,  0.0,   0.0],
+        [0.0,  cos_e, sin_e],
+        [0.0, -sin_e, cos_e],
+    ])
+    R.setflags(write=False) # La devuelve la caché a todos los llamantes
+    return R
+
+def _a_cartesianas(lon, lat):
+    """(Longitud, Latitud) -> vector unitario de forma (3, ...)."""
+    lon, lat = np.broadcast_arrays(lon, lat)
+    v = np.empty((3,) + lon.shape)
+    utils.spherical_to_cartesian(1.0, lon, lat, out=v)
+    return v
+
+def _a_esfericas(v):
+    """Vector unitario (3, ...) -> (Longitud en [0, 2pi), Latitud)."""
+    _, lon, lat = utils.cartesian_to_spherical(v[0], v[1], v[2])
+    return lon, lat
+
 # --- Fórmulas Matemáticas Vectoriales (Abad, Docobo, Elipe) ---
 
+class _MathEscalar:
+    """Backend con la misma interfaz que NumPy pero sobre `math` (floats sueltos)."""
+    sin = staticmethod(math.sin)
+    cos = staticmethod(math.cos)
+    arcsin = staticmethod(math.asin)
+    arccos = staticmethod(math.acos)
+    arctan2 = staticmethod(math.atan2)
+
+    @staticmethod
+    def clip(x, lo, hi):
+        # NaN pasa sin tocar, como en np.clip (max/min lo convertirían en lo/hi)
+        return x if x != x else max(lo, min(hi, x))
+
+def _backend(*vals):
+    """`math` si todos los valores son escalares finitos (evita crear arrays 0-d),
+    si no NumPy. inf/NaN van por NumPy para devolver NaN en lugar de que `math`
+    lance ValueError."""
+    if utils.son_escalares(*vals) and all(math.isfinite(v) for v in vals):
+        return _MathEscalar
+    return np
+
 def _horizontal_to_horary(A, z, phi):
     """(Azimut, Zenital) -> (H, Delta). A desde el SUR."""
-    sin_z, cos_z = np.sin(z), np.cos(z)
-    sin_A, cos_A = np.sin(A), np.cos(A)
-    sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+    xp = _backend(A, z, phi)
+    sin_z, cos_z = xp.sin(z), xp.cos(z)
+    sin_A, cos_A = xp.sin(A), xp.cos(A)
+    sin_phi, cos_phi = xp.sin(phi), xp.cos(phi)
 
     sin_delta = -sin_z * cos_A * cos_phi + cos_z * sin_phi
-    delta = np.arcsin(np.clip(sin_delta, -1, 1))
+    delta = xp.arcsin(xp.clip(sin_delta, -1, 1))
     
     y = sin_z * sin_A
     x = sin_z * cos_A * sin_phi + cos_z * cos_phi
-    H = np.arctan2(y, x)
+    H = xp.arctan2(y, x)
     return utils.normalize_rad(H), delta
 
 def _horary_to_horizontal(H, delta, phi):
     """(H, Delta) -> (Azimut, Zenital). Retorna A desde el SUR."""
-    sin_d, cos_d = np.sin(delta), np.cos(delta)
-    sin_H, cos_H = np.sin(H), np.cos(H)
-    sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+    xp = _backend(H, delta, phi)
+    sin_d, cos_d = xp.sin(delta), xp.cos(delta)
+    sin_H, cos_H = xp.sin(H), xp.cos(H)
+    sin_phi, cos_phi = xp.sin(phi), xp.cos(phi)
 
     cos_z = cos_d * cos_H * cos_phi + sin_d * sin_phi
-    z = np.arccos(np.clip(cos_z, -1, 1))
+    z = xp.arccos(xp.clip(cos_z, -1, 1))
 
     num = cos_d * sin_H
     den = cos_d * cos_H * sin_phi - sin_d * cos_phi
-    A = np.arctan2(num, den)
+    A = xp.arctan2(num, den)
     return utils.normalize_rad(A), z
 
 def _equatorial_to_ecliptic(alpha, delta, eps):
-    sin_d, cos_d = np.sin(delta), np.cos(delta)
-    sin_a, cos_a = np.sin(alpha), np.cos(alpha)
-    sin_e, cos_e = np.sin(eps), np.cos(eps)
+    xp = _backend(alpha, delta, eps)
+    sin_d, cos_d = xp.sin(delta), xp.cos(delta)
+    sin_a, cos_a = xp.sin(alpha), xp.cos(alpha)
+    sin_e, cos_e = xp.sin(eps), xp.cos(eps)
 
     sin_b = -cos_d * sin_a * sin_e + sin_d * cos_e
-    beta = np.arcsin(np.clip(sin_b, -1, 1))
+    beta = xp.arcsin(xp.clip(sin_b, -1, 1))
     
     y = cos_d * sin_a * cos_e + sin_d * sin_e
     x = cos_d * cos_a
-    lamb = np.arctan2(y, x)
+    lamb = xp.arctan2(y, x)
     return utils.normalize_rad(lamb), beta
 
 def _ecliptic_to_equatorial(lamb, beta, eps):
-    sin_b, cos_b = np.sin(beta), np.cos(beta)
-    sin_l, cos_l = np.sin(lamb), np.cos(lamb)
-    sin_e, cos_e = np.sin(eps), np.cos(eps)
+    xp = _backend(lamb, beta, eps)
+    sin_b, cos_b = xp.sin(beta), xp.cos(beta)
+    sin_l, cos_l = xp.sin(lamb), xp.cos(lamb)
+    sin_e, cos_e = xp.sin(eps), xp.cos(eps)
 
     sin_d = cos_b * sin_l * sin_e + sin_b * cos_e
-    delta = np.arcsin(np.clip(sin_d, -1, 1))
+    delta = xp.arcsin(xp.clip(sin_d, -1, 1))
     
     y = cos_b * sin_l * cos_e - sin_b * sin_e
     x = cos_b * cos_l
-    alpha = np.arctan2(y, x)
+    alpha = xp.arctan2(y, x)
     return utils.normalize_rad(alpha), delta
 
 def _equatorial_to_galactic(alpha, delta):
-    # J2000
-    ap = np.radians(192.85948)
-    dp = np.radians(27.12825)
-    lnode = np.radians(32.93192)
-    
-    sin_d, cos_d = np.sin(delta), np.cos(delta)
-    sin_dp, cos_dp = np.sin(dp), np.cos(dp)
+    xp = _backend(alpha, delta)
+    sin_d, cos_d = xp.sin(delta), xp.cos(delta)
+    sin_dp, cos_dp = _SIN_DP, _COS_DP
     
-    diff = alpha - ap
-    sin_b = sin_d * sin_dp + cos_d * cos_dp * np.cos(diff)
-    b = np.arcsin(np.clip(sin_b, -1, 1))
+    diff = alpha - _AP
+    sin_diff, cos_diff = xp.sin(diff), xp.cos(diff)
+    sin_b = sin_d * sin_dp + cos_d * cos_dp * cos_diff
+    b = xp.arcsin(xp.clip(sin_b, -1, 1))
     
-    y = cos_d * np.sin(diff)
-    x = sin_d * cos_dp - cos_d * sin_dp * np.cos(diff)
-    l = lnode - np.arctan2(y, x)
+    y = cos_d * sin_diff
+    x = sin_d * cos_dp - cos_d * sin_dp * cos_diff
+    l = _L_NCP - xp.arctan2(y, x)
     return utils.normalize_rad(l), b
 
 def _galactic_to_equatorial(l, b):
-    # J2000
-    ap = np.radians(192.85948)
-    dp = np.radians(27.12825)
-    lnode = np.radians(32.93192)
-    
-    sin_b, cos_b = np.sin(b), np.cos(b)
-    sin_dp, cos_dp = np.sin(dp), np.cos(dp)
-    
-    diff_l = l - lnode
-    sin_d = np.sin(b) * np.sin(dp) + np.cos(b) * np.cos(dp) * np.cos(diff_l) # Corrección signo
-    # Nota: Usamos la simetría inversa directa
-    # sin(d) = cos(b) cos(dp) sin(l-lnode)... no, la fórmula rigurosa es:
-    y = np.cos(b) * np.sin(l - lnode)
-    x = np.sin(b) * np.cos(dp) - np.cos(b) * np.sin(dp) * np.cos(l - lnode)
+    xp = _backend(l, b)
+    sin_b, cos_b = xp.sin(b), xp.cos(b)
+    sin_dp, cos_dp = _SIN_DP, _COS_DP
     
-    sin_d = np.sin(b) * np.sin(dp) + np.cos(b) * np.cos(dp) * np.cos(l - lnode)
-    delta = np.arcsin(np.clip(sin_d, -1, 1))
+    # Inversa de _equatorial_to_galactic: el ángulo en el polo es (l_NCP - l)
+    diff_l = _L_NCP - l
+    sin_diff, cos_diff = xp.sin(diff_l), xp.cos(diff_l)
+    sin_d = sin_b * sin_dp + cos_b * cos_dp * cos_diff
+    delta = xp.arcsin(xp.clip(sin_d, -1, 1))
     
-    alpha = np.arctan2(y, x) + ap
+    y = cos_b * sin_diff
+    x = sin_b * cos_dp - cos_b * sin_dp * cos_diff
+    alpha = xp.arctan2(y, x) + _AP
     return utils.normalize_rad(alpha), delta
 
 # ==============================================================================
 # Gestión de Unidades y Contexto
 # ==============================================================================
 
+def _radianes(x):
+    """np.radians sin el coste de dispatch de ufunc para floats sueltos."""
+    return math.radians(x) if utils.son_escalares(x) else np.radians(x)
+
+def _grados(x):
+    """np.degrees sin el coste de dispatch de ufunc para floats sueltos."""
+    return math.degrees(x) if utils.son_escalares(x) else np.degrees(x)
+
 def _normalizar_contexto(kwargs):
     """Convierte parámetros auxiliares (phi, TS) a radianes si vienen con sufijos."""
     ctx = kwargs.copy()
     
     # Latitud
     if 'phi_deg' in ctx:
-        ctx['phi'] = np.radians(ctx.pop('phi_deg'))
+        ctx['phi'] = _radianes(ctx.pop('phi_deg'))
     elif 'phi' in ctx:
         pass # Asumimos radianes
         
     # Tiempo Sidéreo
     if 'TS_h' in ctx: # TS en horas decimales
-        ctx['TS'] = np.radians(ctx.pop('TS_h') * 15.0)
+        ctx['TS'] = _radianes(ctx.pop('TS_h') * 15.0)
     elif 'TS_deg' in ctx:
-        ctx['TS'] = np.radians(ctx.pop('TS_deg'))
+        ctx['TS'] = _radianes(ctx.pop('TS_deg'))
         
     # Oblicuidad
     if 'epsilon_deg' in ctx:
-        ctx['epsilon'] = np.radians(ctx.pop('epsilon_deg'))
+        ctx['epsilon'] = _radianes(ctx.pop('epsilon_deg'))
         
     return ctx
 
@@ -282,17 +500,21 @@ def _input_a_rad(val, unidad, es_tiempo=False):
     if unidad == Unidad.RAD:
         return val
     elif unidad == Unidad.DEG:
-        return np.radians(val)
+        return _radianes(val)
     elif unidad == Unidad.HOUR:
-        return np.radians(val * 15.0)
+        return _radianes(val * 15.0)
     elif unidad == Unidad.DMS:
         # Se espera tupla (g, m, s) o array Nx3
+        if _es_terna_escalar(val): # Un solo ángulo, sin construir arrays
+            return utils.to_rad(val[0], val[1], val[2])
         val = np.array(val)
         if val.ndim == 1 and val.shape[0] == 3: # Un solo ángulo
             return utils.to_rad(val[0], val[1], val[2])
         # Vectorizado pendiente para arrays grandes, aquí simple:
         return utils.to_rad(val[...,0], val[...,1], val[...,2])
     elif unidad == Unidad.HMS:
+        if _es_terna_escalar(val):
+            return utils.hms_to_rad(val[0], val[1], val[2])
         val = np.array(val)
         if val.ndim == 1 and val.shape[0] == 3:
             return utils.hms_to_rad(val[0], val[1], val[2])
@@ -300,19 +522,23 @@ def _input_a_rad(val, unidad, es_tiempo=False):
     else:
         raise ValueError(f"Unidad de entrada desconocida: {unidad}")
 
+def _es_terna_escalar(val):
+    """True si val es una tupla/lista (a, b, c) de números sueltos."""
+    return isinstance(val, (tuple, list)) and len(val) == 3 and utils.son_escalares(*val)
+
 def _rad_a_output(val_rad, unidad, es_tiempo=False):
     """Convierte radianes al formato de salida deseado."""
     if unidad == Unidad.RAD:
         return val_rad
     elif unidad == Unidad.DEG:
-        deg = np.degrees(val_rad)
+        deg = _grados(val_rad)
         if not es_tiempo: # Normalizar latitud a [-90, 90] si fuera necesario? No, el cálculo ya lo da.
             # Normalizar longitud a [0, 360)
             pass
         return deg
     elif unidad == Unidad.HOUR:
         # Normalizar a [0, 24)
-        return (np.degrees(val_rad) / 15.0) % 24.0
+        return (_grados(val_rad) / 15.0) % 24.0
     elif unidad == Unidad.DMS:
         return utils.rad_to_dms(val_rad)
     elif unidad == Unidad.HMS:
@@ -11,4 +11,9 @@ F_EARTH = 1.0 / 298.257   # Achatamiento (f)
 E_EARTH_SQ = F_EARTH * (2 - F_EARTH) # Excentricidad al cuadrado (e^2)
 
 # Oblicuidad de la eclíptica (J2000.0 estándar aproximado para ejercicios)
-EPSILON_J2000 = np.radians(23 + 26/60 + 21.448/3600)
\ No newline at end of file
+EPSILON_J2000 = np.radians(23 + 26/60 + 21.448/3600)
+
+# Polo galáctico y nodo (J2000)
+ALPHA_GP_J2000 = np.radians(192.85948)  # Ascensión recta del polo norte galáctico
+DELTA_GP_J2000 = np.radians(27.12825)   # Declinación del polo norte galáctico
+L_NODE_J2000 = np.radians(32.93192)     # Longitud galáctica del nodo ascendente del ecuador
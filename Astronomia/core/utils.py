@@ -1,16 +1,48 @@
 """Utilidades matemáticas y de conversión."""
+import math
 import numpy as np
 
+_INV_60 = 1.0 / 60.0
+_INV_3600 = 1.0 / 3600.0
+
+# Números sueltos de Python o de NumPy (np.int64, np.float64...); no arrays 0-d
+_ESCALARES = (int, float, np.integer, np.floating)
+
+def son_escalares(*vals):
+    """True si todos los valores son números sueltos (criterio único para elegir
+    entre el camino `math` y el camino NumPy)."""
+    return all(isinstance(v, _ESCALARES) for v in vals)
+
 def to_rad(d, m=0, s=0, sign=1):
-    """Convierte GMS a radianes. Soporta arrays."""
-    deg = np.abs(d) + m/60.0 + s/3600.0
-    return np.radians(deg) * np.sign(sign if sign != 0 else 1) * np.sign(d if d != 0 else 1)
+    """Convierte GMS a radianes. Soporta arrays.
+
+    El signo lo da el primer componente no nulo de (d, m, s) (o sign < 0) y
+    afecta a toda la terna: (-10, 30, 0) -> -10.5 y (0, -30, 18) -> -0.505,
+    tal y como los escribe to_dms().
+    """
+    if son_escalares(d, m, s, sign):
+        primero = d if d else (m if m else s)
+        negativo = (primero < 0) ^ (sign < 0)
+        rad = math.radians(abs(d) + abs(m)*_INV_60 + abs(s)*_INV_3600)
+        return -rad if negativo else rad
+    d, m, s = np.asarray(d), np.asarray(m), np.asarray(s)
+    primero = np.where(d != 0, d, np.where(m != 0, m, s))
+    negativo = (primero < 0) ^ (np.asarray(sign) < 0)
+    rad = np.radians(np.abs(d) + np.abs(m)*_INV_60 + np.abs(s)*_INV_3600)
+    return np.where(negativo, -rad, rad)
+
+def hms_to_rad(h, m=0, s=0):
+    """Convierte HMS a radianes. Soporta arrays."""
+    horas = h + m*_INV_60 + s*_INV_3600
+    if son_escalares(h, m, s):
+        return math.radians(horas * 15.0)
+    return np.radians(horas * 15.0)
 
 def to_hms(rad):
     """Radianes -> (Horas, Minutos, Segundos)."""
-    # Normalizar a [0, 2pi]
-    rad = rad % (2 * np.pi)
-    hours_dec = np.degrees(rad) / 15.0
+    # Normalizar a [0, 2pi)
+    rad = normalize_rad(rad)
+    hours_dec = math.degrees(rad) / 15.0
     h = int(hours_dec)
     rem = (hours_dec - h) * 60.0
     m = int(rem)
@@ -18,17 +50,97 @@ def to_hms(rad):
     return h, m, s
 
 def to_dms(rad):
-    """Radianes -> (Grados, Minutos, Segundos)."""
-    # Manejo de signo
-    deg_dec = np.degrees(rad)
-    sign = 1 if deg_dec >= 0 else -1
-    deg_dec = np.abs(deg_dec)
+    """Radianes -> (Grados, Minutos, Segundos).
+
+    El signo va en el primer componente no nulo: -0.5 grados -> (0, -30, 0.0),
+    que to_rad() convierte de vuelta a -0.5 grados.
+    """
+    deg_dec = math.degrees(rad)
+    negativo = deg_dec < 0
+    deg_dec = abs(deg_dec)
     d = int(deg_dec)
     rem = (deg_dec - d) * 60.0
     m = int(rem)
     s = (rem - m) * 60.0
-    return sign * d, m, s
+    if negativo:
+        if d:
+            d = -d
+        elif m:
+            m = -m
+        else:
+            s = -s
+    return d, m, s
+
+def rad_to_hms(rad):
+    """Radianes -> (Horas, Minutos, Segundos). Soporta arrays."""
+    if son_escalares(rad):
+        return to_hms(rad)
+    hours_dec = np.degrees(normalize_rad(np.asarray(rad))) / 15.0
+    h = np.trunc(hours_dec)
+    rem = (hours_dec - h) * 60.0
+    m = np.trunc(rem)
+    s = (rem - m) * 60.0
+    return h.astype(int), m.astype(int), s
+
+def rad_to_dms(rad):
+    """Radianes -> (Grados, Minutos, Segundos). Soporta arrays (signo como to_dms)."""
+    if son_escalares(rad):
+        return to_dms(rad)
+    deg_dec = np.degrees(np.asarray(rad))
+    negativo = deg_dec < 0
+    deg_dec = np.abs(deg_dec)
+    d = np.trunc(deg_dec)
+    rem = (deg_dec - d) * 60.0
+    m = np.trunc(rem)
+    s = (rem - m) * 60.0
+    d, m = d.astype(int), m.astype(int)
+    neg_d = negativo & (d != 0)
+    neg_m = negativo & (d == 0) & (m != 0)
+    neg_s = negativo & (d == 0) & (m == 0)
+    return np.where(neg_d, -d, d), np.where(neg_m, -m, m), np.where(neg_s, -s, s)
+
+def normalize_rad(angle):
+    """Normaliza ángulos entre [0, 2pi). Soporta arrays."""
+    angle = angle % (2 * np.pi)
+    # Para negativos diminutos (-1e-17) el módulo redondea a 2pi exacto
+    if son_escalares(angle):
+        return 0.0 if angle == 2 * np.pi else angle
+    return np.where(angle == 2 * np.pi, 0.0, angle)
 
 def normalize_pi(angle):
     """Normaliza ángulos entre [-pi, pi]."""
-    return (angle + np.pi) % (2 * np.pi) - np.pi
\ No newline at end of file
+    return (angle + np.pi) % (2 * np.pi) - np.pi
+
+def spherical_to_cartesian(r, lon, lat, out=None):
+    """(r, Longitud, Latitud) -> (x, y, z). Soporta arrays.
+
+    Si se pasa `out` (buffer de forma (3, ...)), los componentes se escriben
+    en él: la trigonometría se evalúa directamente sobre el buffer, sin
+    arrays intermedios, y con r == 1 se omiten los productos por r.
+    """
+    if out is None:
+        cos_lat = np.cos(lat)
+        return r * cos_lat * np.cos(lon), r * cos_lat * np.sin(lon), r * np.sin(lat)
+    unitario = son_escalares(r) and r == 1
+    x, y, z = out[0, ...], out[1, ...], out[2, ...]  # vistas (0-d si out es (3,))
+    np.cos(lat, out=z)          # z guarda r*cos(lat) provisionalmente
+    if not unitario:
+        z *= r
+    np.cos(lon, out=x)
+    x *= z
+    np.sin(lon, out=y)
+    y *= z
+    np.sin(lat, out=z)
+    if not unitario:
+        z *= r
+    return x, y, z
+
+def cartesian_to_spherical(x, y, z):
+    """(x, y, z) -> (r, Longitud en [0, 2pi), Latitud). Soporta arrays."""
+    # hypot escala internamente (sin overflow/underflow en x*x) y
+    # atan2(z, rho) evita el arcsin + clip (y la división por r = 0)
+    rho = np.hypot(x, y)
+    r = np.hypot(rho, z)
+    lon = normalize_rad(np.arctan2(y, x))
+    lat = np.arctan2(z, rho)
+    return r, lon, lat
@@ -7,6 +7,7 @@ Punto de entrada principal del proyecto.
 • El menú es generado dinámicamente a partir de los capítulos cargados.
 """
 
+import importlib
 import sys
 
 
@@ -15,12 +16,14 @@ import sys
 #   Cada capítulo debe exponer: get_menu_entry() → (id, título, función)
 # ============================================================================
 
-# Importa aquí los capítulos que tengas:
-from cap1.menu import get_menu_entry as cap1_entry
-# Cuando tengas más capítulos:
-# from cap2.menu import get_menu_entry as cap2_entry
-# from cap3.menu import get_menu_entry as cap3_entry
-# ...
+# (módulo, función de entrada). Los módulos se importan en cargar_capitulos(),
+# no al importar main.py, para no pagar numpy & cía. en el arranque.
+CAPITULOS = [
+    ("cap1.menu", "get_menu_entry"),
+    # Cuando tengas más capítulos:
+    # ("cap2.menu", "get_menu_entry"),
+    # ("cap3.menu", "get_menu_entry"),
+]
 
 
 def cargar_capitulos():
@@ -28,12 +31,10 @@ def cargar_capitulos():
     Devuelve la lista de capítulos registrados.
     Cada entrada es una tupla: (id, texto_visible, funcion_menu)
     """
-    capitulos = [
-        cap1_entry(),
-        # Agrega más capítulos simplemente añadiendo:
-        # cap2_entry(),
-        # cap3_entry(),
-    ]
+    capitulos = []
+    for modulo, funcion in CAPITULOS:
+        mod = importlib.import_module(modulo)
+        capitulos.append(getattr(mod, funcion)())
     return capitulos
 
 
@@ -0,0 +1,2 @@
+# Raíz del repositorio: pytest añade este directorio a sys.path, de modo que
+# los tests importan el paquete como `Astronomia.*` (imports relativos incluidos).
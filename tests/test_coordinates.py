@@ -0,0 +1,130 @@
+import math
+import warnings
+
+import numpy as np
+import pytest
+
+from Astronomia.chapters import coordinates
+from Astronomia.chapters.coordinates import Sistema, Unidad, transformar
+
+
+def _dif_angular(a, b):
+    """Diferencia en grados reducida a [-180, 180)."""
+    return (np.asarray(a) - b + 180.0) % 360.0 - 180.0
+
+
+def _a_galactico(alpha, delta):
+    return transformar(alpha, delta, Sistema.ECUATORIAL, Sistema.GALACTICO,
+                       Unidad.DEG, Unidad.DEG)
+
+
+def _a_ecuatorial(l, b):
+    return transformar(l, b, Sistema.GALACTICO, Sistema.ECUATORIAL,
+                       Unidad.DEG, Unidad.DEG)
+
+
+def test_centro_galactico():
+    # Sgr A* (J2000): alpha = 266.40499, delta = -28.93617 -> (l, b) ~ (0, 0)
+    l, b = _a_galactico(266.40499, -28.93617)
+    assert abs(_dif_angular(l, 0.0)) < 1e-3
+    assert abs(b) < 1e-3
+
+
+def test_polo_norte_galactico():
+    _, b = _a_galactico(192.85948, 27.12825)
+    assert abs(b - 90.0) < 1e-6
+
+
+def test_polo_norte_celeste():
+    l, b = _a_galactico(0.0, 90.0)
+    assert abs(_dif_angular(l, 122.93192)) < 1e-6
+    assert abs(b - 27.12825) < 1e-6
+
+
+def test_galactico_a_ecuatorial():
+    alpha, delta = _a_ecuatorial(0.0, 0.0)
+    assert abs(_dif_angular(alpha, 266.40499)) < 1e-3
+    assert abs(delta + 28.93617) < 1e-3
+
+
+def test_galactico_ida_y_vuelta_escalar_y_array():
+    alpha = np.array([0.0, 45.0, 192.85948, 266.40499, 359.0])
+    delta = np.array([-60.0, 10.0, 0.0, -28.93617, 45.0])
+    l, b = _a_galactico(alpha, delta)
+    a2, d2 = _a_ecuatorial(l, b)
+    assert np.allclose(_dif_angular(a2, alpha), 0.0, atol=1e-9)
+    assert np.allclose(d2, delta, atol=1e-9)
+    for i in range(len(alpha)):
+        li, bi = _a_galactico(float(alpha[i]), float(delta[i]))
+        assert abs(_dif_angular(li, l[i])) < 1e-9
+        assert abs(bi - b[i]) < 1e-9
+
+
+def test_escalares_no_finitos_devuelven_nan():
+    assert math.isnan(coordinates._MathEscalar.clip(float('nan'), -1, 1))
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        lamb, beta = coordinates._equatorial_to_ecliptic(float('nan'), 0.3, 0.4)
+        assert math.isnan(lamb) and math.isnan(beta)
+        res = transformar(float('inf'), 0.1, Sistema.ECUATORIAL, Sistema.ECLIPTICO)
+    assert all(math.isnan(v) for v in res)
+
+
+def test_transformar_lote_igual_que_transformar():
+    rng = np.random.default_rng(0)
+    n = 2_501
+    alpha = rng.uniform(0.0, 360.0, n)
+    delta = rng.uniform(-80.0, 80.0, n)
+    ts_h = rng.uniform(0.0, 24.0, n)  # contexto por estrella
+    args = (alpha, delta, Sistema.ECUATORIAL, Sistema.HORIZONTAL, Unidad.DEG, Unidad.DEG)
+    esperado = transformar(*args, phi_deg=40.0, TS_h=ts_h)
+    res = coordinates.transformar_lote(*args, n_workers=2, chunksize=1_000,
+                                       phi_deg=40.0, TS_h=ts_h)
+    assert np.allclose(res[0], esperado[0]) and np.allclose(res[1], esperado[1])
+
+
+def test_transformar_lote_entradas_como_transformar():
+    lote = coordinates.transformar_lote
+    args = (Sistema.ECUATORIAL, Sistema.ECLIPTICO, Unidad.DEG, Unidad.DEG)
+    # Escalares y broadcasting (c2 escalar) se aceptan igual que en transformar()
+    assert np.allclose(lote(10.0, 20.0, *args, n_workers=2),
+                       transformar(10.0, 20.0, *args))
+    alpha = np.linspace(0.0, 350.0, 30)
+    res = lote(alpha, 20.0, *args, n_workers=2, chunksize=7)
+    esperado = transformar(alpha, np.full_like(alpha, 20.0), *args)
+    assert np.allclose(res[0], esperado[0]) and np.allclose(res[1], esperado[1])
+    for chunksize in (0, -5):
+        with pytest.raises(ValueError):
+            lote(alpha, 20.0, *args, chunksize=chunksize)
+    with pytest.raises(ValueError, match="uno por estrella"):
+        lote(alpha, 20.0, Sistema.ECUATORIAL, Sistema.HORARIO, n_workers=2,
+             chunksize=7, TS=np.zeros(5))
+
+
+PARES_DOS_ETAPAS = [
+    (Sistema.HORIZONTAL, Sistema.GALACTICO), (Sistema.GALACTICO, Sistema.HORIZONTAL),
+    (Sistema.ECLIPTICO, Sistema.GALACTICO), (Sistema.GALACTICO, Sistema.ECLIPTICO),
+    (Sistema.HORARIO, Sistema.HORIZONTAL), (Sistema.HORIZONTAL, Sistema.HORARIO),
+    (Sistema.HORIZONTAL, Sistema.ECLIPTICO), (Sistema.ECLIPTICO, Sistema.HORIZONTAL),
+]
+
+
+@pytest.mark.parametrize("ts_por_estrella", [False, True], ids=["matricial", "formulas"])
+@pytest.mark.parametrize("origen, destino", PARES_DOS_ETAPAS)
+def test_array_igual_que_escalares_dos_etapas(origen, destino, ts_por_estrella):
+    rng = np.random.default_rng(1)
+    n = 40
+    c1 = rng.uniform(0.0, 2 * np.pi, n)
+    c2 = rng.uniform(-1.4, 1.4, n)
+    ts = rng.uniform(0.0, 2 * np.pi, n) if ts_por_estrella else 1.2
+    ctx = dict(phi=0.7, epsilon=0.41)
+
+    # Contexto escalar -> rotación compuesta; TS por estrella -> fórmulas
+    assert coordinates._es_lote(c1, c2, origen, destino, dict(ctx, TS=ts)) is not ts_por_estrella
+    res1, res2 = transformar(c1, c2, origen, destino, TS=ts, **ctx)
+
+    for i in range(n):
+        ts_i = float(ts[i]) if ts_por_estrella else ts
+        e1, e2 = transformar(float(c1[i]), float(c2[i]), origen, destino, TS=ts_i, **ctx)
+        assert abs(np.angle(np.exp(1j * (res1[i] - e1)))) < 1e-9
+        assert abs(res2[i] - e2) < 1e-9
@@ -0,0 +1,79 @@
+import math
+
+import numpy as np
+
+from Astronomia.chapters.coordinates import Sistema, Unidad, transformar
+from Astronomia.core import utils
+
+
+def test_to_rad_escalar_numpy_devuelve_float():
+    rad = utils.to_rad(np.int64(10), 30, 0)
+    assert type(rad) is float
+    assert math.isclose(rad, math.radians(10.5))
+    assert type(utils.hms_to_rad(np.int64(1), np.float64(30.0), 0)) is float
+
+
+def test_to_rad_signo():
+    assert math.isclose(utils.to_rad(-10, 30, 0), -math.radians(10.5))
+    assert math.isclose(utils.to_rad(10, 30, 0, sign=-1), -math.radians(10.5))
+    assert np.allclose(utils.to_rad(np.array([10, -10]), 30, 0),
+                       np.radians([10.5, -10.5]))
+
+
+def test_dms_negativo_menor_que_un_grado():
+    rad = math.radians(-0.5)
+    assert utils.to_dms(rad) == (0, -30, 0.0)
+    assert math.isclose(utils.to_rad(*utils.to_dms(rad)), rad)
+    d, m, s = utils.rad_to_dms(np.radians([-0.5, -10.5, -1 / 7200, 0.5]))
+    assert list(d) == [0, -10, 0, 0]
+    assert list(m) == [-30, 30, 0, 30]
+    assert np.allclose(s, [0.0, 0.0, -0.5, 0.0])
+    assert np.allclose(utils.to_rad(d, m, s),
+                       np.radians([-0.5, -10.5, -1 / 7200, 0.5]))
+
+
+def test_normalize_rad_nunca_devuelve_2pi():
+    assert utils.normalize_rad(-1e-17) == 0.0
+    assert np.all(utils.normalize_rad(np.array([-1e-17, -1.0])) < 2 * np.pi)
+    assert utils.rad_to_hms(-1e-17) == (0, 0, 0.0)
+
+
+def test_spherical_to_cartesian_out():
+    lon = np.array([0.0, 1.0, 4.0])
+    lat = np.array([0.5, -0.2, 1.2])
+    r = np.array([1.0, 2.0, 3.0])
+    for radio in (1.0, r):
+        esperado = utils.spherical_to_cartesian(radio, lon, lat)
+        buf = np.empty((3, 3))
+        res = utils.spherical_to_cartesian(radio, lon, lat, out=buf)
+        assert np.allclose(buf, esperado)
+        assert all(np.shares_memory(c, buf) for c in res)
+    # Un solo punto con buffer (3,)
+    buf = np.empty(3)
+    for radio in (1.0, 2.0):
+        utils.spherical_to_cartesian(radio, 1.0, 0.5, out=buf)
+        assert np.allclose(buf, utils.spherical_to_cartesian(radio, 1.0, 0.5))
+    r2, lon2, lat2 = utils.cartesian_to_spherical(*utils.spherical_to_cartesian(r, lon, lat))
+    assert np.allclose(r2, r) and np.allclose(lon2, lon) and np.allclose(lat2, lat)
+
+
+def test_dms_ida_y_vuelta_negativos_menores_que_un_grado():
+    grados = [-0.505, -0.0125, -0.5, -10.505, 0.505]
+    for g in grados:
+        rad = math.radians(g)
+        assert math.isclose(utils.to_rad(*utils.to_dms(rad)), rad, abs_tol=1e-15)
+    d, m, s = utils.to_dms(math.radians(-0.0125))
+    assert (d, m) == (0, 0) and math.isclose(s, -45.0)
+    assert math.isclose(utils.to_rad(0, -30, 18), math.radians(-0.505))
+    assert math.isclose(utils.to_rad(0, 0, -45), math.radians(-0.0125))
+
+    rad = np.radians(grados)
+    assert np.allclose(utils.to_rad(*utils.rad_to_dms(rad)), rad, atol=1e-15)
+    assert np.allclose(utils.to_rad(np.array([0, 0]), np.array([-30, 0]), np.array([18, -45])),
+                       np.radians([-0.505, -0.0125]))
+
+
+def test_transformar_dms_negativo_menor_que_un_grado():
+    _, delta = transformar((1, 0, 0), (0, -30, 18), Sistema.ECUATORIAL, Sistema.ECUATORIAL,
+                           Unidad.DMS, Unidad.DEG)
+    assert math.isclose(delta, -0.505)